@@ -1,4 +1,9 @@
-from collections import defaultdict
+from array import array
+from collections import defaultdict, deque
+from collections.abc import MutableMapping
+from heapq import heappop, heappush
+from itertools import accumulate, groupby
+from operator import itemgetter
 import unittest
 import random
 
@@ -8,59 +13,156 @@ class Graph:
     Graph class to represent an undirected graph using an adjacency list.
     
     Attributes:
-        adjacency_list (defaultdict): A dictionary of sets where each key is a vertex, and the value is a set of neighbors.
+        adjacency_list (defaultdict): A dictionary of lists where each key is a vertex, and the value is a list of its neighbors, made distinct by finalize().
         vertices (set): A set of vertices in the graph.
+        vertex_index (dict): Maps each vertex to its contiguous id in [0, n), built by finalize().
+        vertex_labels (list): Maps each contiguous id back to its vertex, built by finalize().
+        indptr (array): CSR row pointers; neighbors of id i are indices[indptr[i]:indptr[i + 1]].
+        indices (array): CSR column indices holding the neighbor ids of every vertex back to back.
+        changed_vertices (set): Vertices touched by mutations since the consumer last cleared it.
     
     Methods:
         add_vertex(vertex): Adds a vertex to the graph.
         add_edge(u, v): Adds an undirected edge between vertices u and v.
+        add_edges_bulk(pairs): Adds an undirected edge for every (u, v) pair in an iterable.
         remove_vertex(vertex): Removes a vertex and its associated edges.
         remove_edge(u, v): Removes the edge between vertices u and v.
-        neighbors(vertex): Returns the set of neighbors for a given vertex.
+        neighbors(vertex): Returns the list of neighbors for a given vertex.
+        neighbor_ids(index): Returns the CSR slice of neighbor ids for a given vertex id.
+        finalize(): Builds the compressed-sparse-row (CSR) arrays used by the solvers.
         apply_dynamic_changes(changes): Applies dynamic changes (like adding/removing vertices or edges) to the graph.
         print_graph(): Prints the vertices and edges of the graph.
     """
     def __init__(self):
-        self.adjacency_list = defaultdict(set)
+        self.adjacency_list = defaultdict(list)
         self.vertices = set()
+        self.vertex_index = {}
+        self.vertex_labels = []
+        self.indptr = None
+        self.indices = None
+        self.changed_vertices = set()
 
     def add_vertex(self, vertex):
         """Adds a vertex to the graph."""
         self.vertices.add(vertex)
+        self.changed_vertices.add(vertex)
+        self.indptr = None
 
     def add_edge(self, u, v):
         """Adds an undirected edge between vertices u and v."""
-        self.adjacency_list[u].add(v)
-        self.adjacency_list[v].add(u)
+        # Appending without a membership test keeps every insert O(1), even on a hub vertex.
+        # A repeated edge leaves a duplicate entry that finalize() drops.
+        self.adjacency_list[u].append(v)
+        if u != v:
+            self.adjacency_list[v].append(u)
+        self.changed_vertices.add(u)
+        self.changed_vertices.add(v)
+        self.indptr = None
+
+    def add_edges_bulk(self, pairs):
+        """Adds an undirected edge for every (u, v) pair in an iterable."""
+        adjacency_list = self.adjacency_list
+        changed_vertices = self.changed_vertices
+        added = False
+        for u, v in pairs:
+            adjacency_list[u].append(v)
+            if u != v:
+                adjacency_list[v].append(u)
+            changed_vertices.add(u)
+            changed_vertices.add(v)
+            added = True
+        if added:
+            self.indptr = None
 
     def remove_vertex(self, vertex):
         """Removes a vertex and its associated edges."""
         self.vertices.remove(vertex)
-        for neighbor in list(self.adjacency_list[vertex]):
-            self.adjacency_list[neighbor].remove(vertex)
-        del self.adjacency_list[vertex]
+        # Detaching the neighbor list from the dict lets it be iterated without a copy. A
+        # repeated edge appears once per copy in both lists, so each visit removes one copy.
+        for neighbor in self.adjacency_list.pop(vertex, ()):
+            if neighbor != vertex:
+                self.adjacency_list[neighbor].remove(vertex)
+        self.changed_vertices.add(vertex)
+        self.indptr = None
 
     def remove_edge(self, u, v):
         """Removes the edge between vertices u and v."""
-        self.adjacency_list[u].remove(v)
-        self.adjacency_list[v].remove(u)
+        # remove() raises if the edge is missing; the filter then drops any duplicates that
+        # add_edge left since the last finalize().
+        adjacency_list = self.adjacency_list
+        adjacency_list[u].remove(v)
+        if v in adjacency_list[u]:
+            adjacency_list[u] = [w for w in adjacency_list[u] if w != v]
+        if u != v:
+            adjacency_list[v].remove(u)
+            if u in adjacency_list[v]:
+                adjacency_list[v] = [w for w in adjacency_list[v] if w != u]
+        self.changed_vertices.add(u)
+        self.changed_vertices.add(v)
+        self.indptr = None
 
     def neighbors(self, vertex):
-        """Returns the set of neighbors for a given vertex."""
+        """Returns the list of neighbors for a given vertex."""
         return self.adjacency_list[vertex]
 
+    def neighbor_ids(self, index):
+        """Returns the CSR slice of neighbor ids for a given vertex id."""
+        return self.indices[self.indptr[index]:self.indptr[index + 1]]
+
+    def finalize(self):
+        """
+        Builds the compressed-sparse-row (CSR) arrays used by the solvers.
+
+        Vertices are mapped to contiguous ids, with the members of `vertices` first so that
+        ids [0, len(vertices)) are exactly the vertices to color. Endpoints that were only
+        added through add_edge get the remaining ids. Repeated edges are dropped from the
+        neighbor lists here, once, instead of on every insert. The arrays are rebuilt lazily:
+        any mutation of the graph invalidates them and the next call recomputes them.
+        """
+        if self.indptr is not None:
+            return
+        labels = list(self.vertices)
+        labels.extend(v for v in self.adjacency_list if v not in self.vertices)
+        index = {vertex: i for i, vertex in enumerate(labels)}
+        adjacency_list = self.adjacency_list
+        for vertex, neighbors in adjacency_list.items():
+            if len(neighbors) > 1:
+                distinct = list(dict.fromkeys(neighbors))
+                if len(distinct) < len(neighbors):
+                    adjacency_list[vertex] = distinct
+        degrees = [len(adjacency_list[vertex]) if vertex in adjacency_list else 0 for vertex in labels]
+        indptr = array('i', [0])
+        indptr.extend(accumulate(degrees))
+        indices = array('i')
+        for vertex in labels:
+            if vertex in adjacency_list:
+                indices.extend([index[neighbor] for neighbor in adjacency_list[vertex]])
+        self.vertex_index = index
+        self.vertex_labels = labels
+        self.indices = indices
+        self.indptr = indptr
+
     def apply_dynamic_changes(self, changes):
-        """Applies dynamic changes (like adding/removing vertices or edges) to the graph."""
-        for change in changes:
-            action, u, v = change
+        """
+        Applies dynamic changes (like adding/removing vertices or edges) to the graph.
+
+        Consecutive changes with the same action are dispatched once and applied as a batch,
+        so the changes still take effect in the order given.
+        """
+        for action, group in groupby(changes, key=itemgetter(0)):
             if action == 'add_vertex':
-                self.add_vertex(u)
+                added = [u for _, u, _ in group]
+                self.vertices.update(added)
+                self.changed_vertices.update(added)
+                self.indptr = None
             elif action == 'remove_vertex':
-                self.remove_vertex(u)
+                for _, u, _ in group:
+                    self.remove_vertex(u)
             elif action == 'add_edge':
-                self.add_edge(u, v)
+                self.add_edges_bulk((u, v) for _, u, v in group)
             elif action == 'remove_edge':
-                self.remove_edge(u, v)
+                for _, u, v in group:
+                    self.remove_edge(u, v)
 
     def print_graph(self):
         """Prints the vertices and edges of the graph."""
@@ -80,25 +182,39 @@ class ConstraintManager:
         graph (Graph): The graph to manage constraints for.
         pre_assigned_colors (dict): A dictionary mapping vertices to their pre-assigned colors.
         color_exclusions (defaultdict): A dictionary mapping vertices to a set of excluded colors.
+        exclusion_mask (defaultdict): A dictionary mapping vertices to a bitmask of excluded colors (bit c set if color c is excluded), covering the colors that finalize() has reached.
+        deferred_exclusions (list): (vertex, color) exclusions whose color is still too large to need a mask bit.
     
     Methods:
         add_pre_assigned_color(vertex, color): Adds a pre-assigned color constraint to a vertex.
         add_color_exclusion(vertex, color): Adds a color exclusion constraint to a vertex.
         get_pre_assigned_color(vertex): Returns the pre-assigned color for a vertex, if any.
         is_color_excluded(vertex, color): Checks if a color is excluded for a vertex.
+        finalize(num_colors): Gives mask bits to the deferred exclusions of colors below num_colors.
     """
     def __init__(self, graph):
         self.graph = graph
         self.pre_assigned_colors = {}
         self.color_exclusions = defaultdict(set)
+        self.exclusion_mask = defaultdict(int)
+        self.deferred_exclusions = []
 
     def add_pre_assigned_color(self, vertex, color):
         """Adds a pre-assigned color constraint to a vertex."""
+        # Solvers store -1 for "no pre-assigned color", so a negative color cannot be honored.
+        if color < 0:
+            raise ValueError(f"Colors must be non-negative, got {color} for vertex {vertex}")
         self.pre_assigned_colors[vertex] = color
 
     def add_color_exclusion(self, vertex, color):
         """Adds a color exclusion constraint to a vertex."""
         self.color_exclusions[vertex].add(color)
+        # A solve only hands out colors in [0, n), so larger colors wait for finalize() and
+        # negative ones never need a bit. This keeps every mask at most n bits wide.
+        if 0 <= color < len(self.graph.vertices):
+            self.exclusion_mask[vertex] |= 1 << color
+        elif color >= 0:
+            self.deferred_exclusions.append((vertex, color))
 
     def get_pre_assigned_color(self, vertex):
         """Returns the pre-assigned color for a vertex, if any."""
@@ -106,7 +222,158 @@ class ConstraintManager:
 
     def is_color_excluded(self, vertex, color):
         """Checks if a color is excluded for a vertex."""
-        return color in self.color_exclusions[vertex]
+        # The set also holds the colors that have no mask bit yet.
+        return color in self.color_exclusions.get(vertex, ())
+
+    def finalize(self, num_colors):
+        """
+        Gives mask bits to the deferred exclusions of colors below num_colors.
+
+        Solvers call this with the number of colors they may hand out before reading
+        `exclusion_mask`, so exclusions added while the graph was smaller are not missed.
+        """
+        if not self.deferred_exclusions:
+            return
+        exclusion_mask = self.exclusion_mask
+        deferred = []
+        for vertex, color in self.deferred_exclusions:
+            if color < num_colors:
+                exclusion_mask[vertex] |= 1 << color
+            else:
+                deferred.append((vertex, color))
+        self.deferred_exclusions = deferred
+
+# SaturationQueue Class
+class SaturationQueue:
+    """
+    Priority queue of uncolored vertices for DSatur (Brelaz) vertex selection.
+
+    The saturation of a vertex is the number of distinct colors among its colored neighbors.
+    Vertices are kept in a heap keyed by (saturation, degree) with lazy deletion: every change
+    pushes a fresh entry and entries that no longer match the vertex's state are skipped when
+    popped. Only vertex ids that have been pushed are ever returned.
+    
+    Attributes:
+        graph (Graph): The finalized graph whose CSR arrays are used.
+        colors (array): The color of each vertex id, or -1 if it is uncolored; shared with the solver.
+        neighbor_colors (list): For each vertex id, a dict counting its colored neighbors per color.
+        queued (bytearray): Flags the vertex ids that take part in the selection.
+        heap (list): Heap of (-saturation, -degree, id) entries.
+    
+    Methods:
+        push(vertex): Adds an uncolored vertex id to the selection.
+        assign(vertex, color): Colors a vertex id and updates its neighbors' saturation.
+        unassign(vertex): Uncolors a vertex id and updates its neighbors' saturation.
+        pop_max(): Removes and returns the uncolored vertex id with the highest saturation, or -1.
+    """
+    def __init__(self, graph, colors):
+        num_ids = len(graph.vertex_labels)
+        self.graph = graph
+        self.colors = colors
+        self.neighbor_colors = [{} for _ in range(num_ids)]
+        self.queued = bytearray(num_ids)
+        self.heap = []
+
+    def push(self, vertex):
+        """Adds an uncolored vertex id to the selection."""
+        self.queued[vertex] = 1
+        indptr = self.graph.indptr
+        heappush(self.heap, (-len(self.neighbor_colors[vertex]), indptr[vertex] - indptr[vertex + 1], vertex))
+
+    def assign(self, vertex, color):
+        """Colors a vertex id and updates its neighbors' saturation."""
+        colors, neighbor_colors, queued = self.colors, self.neighbor_colors, self.queued
+        colors[vertex] = color
+        for neighbor in self.graph.neighbor_ids(vertex):
+            counts = neighbor_colors[neighbor]
+            count = counts.get(color, 0)
+            counts[color] = count + 1
+            if count == 0 and queued[neighbor] and colors[neighbor] < 0:
+                self.push(neighbor)
+
+    def unassign(self, vertex):
+        """Uncolors a vertex id and updates its neighbors' saturation."""
+        colors, neighbor_colors, queued = self.colors, self.neighbor_colors, self.queued
+        color = colors[vertex]
+        colors[vertex] = -1
+        for neighbor in self.graph.neighbor_ids(vertex):
+            counts = neighbor_colors[neighbor]
+            if counts[color] == 1:
+                del counts[color]
+                if queued[neighbor] and colors[neighbor] < 0:
+                    self.push(neighbor)
+            else:
+                counts[color] -= 1
+
+    def pop_max(self):
+        """Removes and returns the uncolored vertex id with the highest saturation, or -1."""
+        heap, colors, neighbor_colors = self.heap, self.colors, self.neighbor_colors
+        while heap:
+            saturation, _, vertex = heappop(heap)
+            if colors[vertex] < 0 and -saturation == len(neighbor_colors[vertex]):
+                return vertex
+        return -1
+
+# ColorAssignment Class
+class ColorAssignment(MutableMapping):
+    """
+    Live mapping from vertices to colors, backed by a solver's dense `colors` array.
+
+    Lookups and writes go straight to the solver's slots, so handing the mapping out costs
+    nothing and in-place writes are seen by the next solve. Writing a color for a vertex that
+    has no slot yet appends one. Colors must be non-negative integers, since -1 marks an
+    uncolored slot. Solvers return this mapping from solve() instead of a dict, so it is not
+    a dict instance; copy() returns a plain dict, e.g. for json.dumps.
+    
+    Attributes:
+        solver (BaseColoringSolver): The solver whose `colors` array backs the mapping.
+    
+    Methods:
+        copy(): Returns a plain dict snapshot of the mapping.
+    """
+    def __init__(self, solver):
+        self.solver = solver
+
+    def __getitem__(self, vertex):
+        color = self.solver.color_of(vertex)
+        if color < 0:
+            raise KeyError(vertex)
+        return color
+
+    def __setitem__(self, vertex, color):
+        if color < 0:
+            raise ValueError(f"Colors must be non-negative, got {color} for vertex {vertex}")
+        solver = self.solver
+        slot = solver.vertex_index.get(vertex)
+        if slot is None:
+            solver.vertex_index[vertex] = len(solver.vertex_labels)
+            solver.vertex_labels.append(vertex)
+            solver.colors.append(color)
+        else:
+            solver.colors[slot] = color
+
+    def __delitem__(self, vertex):
+        slot = self.solver.vertex_index.get(vertex)
+        if slot is None or self.solver.colors[slot] < 0:
+            raise KeyError(vertex)
+        self.solver.colors[slot] = -1
+
+    def __iter__(self):
+        for vertex, color in zip(self.solver.vertex_labels, self.solver.colors):
+            if color >= 0:
+                yield vertex
+
+    def __len__(self):
+        colors = self.solver.colors
+        return len(colors) - colors.count(-1)
+
+    def __repr__(self):
+        return repr(self.copy())
+
+    def copy(self):
+        """Returns a plain dict snapshot of the mapping."""
+        solver = self.solver
+        return {vertex: color for vertex, color in zip(solver.vertex_labels, solver.colors) if color >= 0}
 
 # BaseColoringSolver Class
 class BaseColoringSolver:
@@ -116,15 +383,57 @@ class BaseColoringSolver:
     Attributes:
         graph (Graph): The graph to be colored.
         constraint_manager (ConstraintManager): Manages constraints for the coloring process.
-        color_assignment (dict): A dictionary mapping vertices to their assigned colors.
+        colors (array): Dense int32 color of each slot, or -1 if the slot is uncolored.
+        vertex_labels (list): The vertex held by each slot of `colors`.
+        vertex_index (dict): Maps each vertex to its slot in `colors`.
+        color_assignment (ColorAssignment): Live mapping of vertices to their assigned colors, backed by `colors`.
     
     Methods:
+        load_colors(keep): Re-keys `colors` to the graph's CSR ids, optionally keeping existing colors.
+        color_of(vertex): Returns the color of a vertex, or -1 if it is uncolored.
         solve(): Abstract method to be implemented by subclasses.
     """
     def __init__(self, graph, constraint_manager):
         self.graph = graph
         self.constraint_manager = constraint_manager
-        self.color_assignment = {}
+        self.colors = array('i')
+        self.vertex_labels = []
+        self.vertex_index = {}
+        self.assignment_view = ColorAssignment(self)
+
+    @property
+    def color_assignment(self):
+        """Live mapping of vertices to their assigned colors, backed by `colors`."""
+        return self.assignment_view
+
+    @color_assignment.setter
+    def color_assignment(self, assignment):
+        self.colors = array('i')
+        self.vertex_labels = []
+        self.vertex_index = {}
+        self.assignment_view.update(assignment)
+
+    def load_colors(self, keep=True):
+        """
+        Re-keys `colors` to the graph's CSR ids, optionally keeping existing colors.
+
+        Slots follow the graph's CSR ids, so kernels can index `colors` with neighbor ids
+        directly. With keep=False every slot starts uncolored.
+        """
+        self.graph.finalize()
+        labels = self.graph.vertex_labels
+        if keep:
+            color_of = self.color_of
+            self.colors = array('i', [color_of(vertex) for vertex in labels])
+        else:
+            self.colors = array('i', [-1]) * len(labels)
+        self.vertex_labels = list(labels)
+        self.vertex_index = dict(self.graph.vertex_index)
+
+    def color_of(self, vertex):
+        """Returns the color of a vertex, or -1 if it is uncolored."""
+        slot = self.vertex_index.get(vertex)
+        return -1 if slot is None else self.colors[slot]
 
     def solve(self):
         raise NotImplementedError("This method should be implemented by subclasses.")
@@ -134,33 +443,286 @@ class GreedyColoringSolver(BaseColoringSolver):
     """
     Implements a greedy algorithm for graph coloring, considering constraints.
     
+    Attributes:
+        uncolored (set): Vertices the last repair left uncolored, or None after a full solve.
+    
     Methods:
+        greedy_csr(indptr, indices, exclusion_mask, pre_colors, out, order): Greedy coloring kernel over CSR arrays.
         solve(): Solves the graph coloring problem using a greedy approach.
+        solve_incremental(changed_vertices): Repairs the current coloring after the given vertices changed.
     """
-    def solve(self):
-        for vertex in self.graph.vertices:
-            if vertex in self.color_assignment:
+    def __init__(self, graph, constraint_manager):
+        super().__init__(graph, constraint_manager)
+        self.uncolored = None
+
+    @staticmethod
+    def greedy_csr(indptr, indices, exclusion_mask, pre_colors, out, order):
+        """
+        Greedy coloring kernel over CSR arrays.
+
+        Colors the vertex ids in `order`, one after another, in place in `out`, where -1 marks
+        an uncolored id. Colors are limited to [0, len(order)). Ids already colored are kept,
+        ids with a pre-assigned color (pre_colors[v] >= 0) take it, and every other id gets
+        the smallest color not used by a neighbor and not set in exclusion_mask[v]. Returns
+        the id whose pre-assigned color conflicts with an already colored neighbor, or -1 if
+        there is none.
+        """
+        num_colors = len(order)
+        for v in order:
+            if out[v] >= 0:
+                continue
+
+            neighbors = indices[indptr[v]:indptr[v + 1]]
+            pre_color = pre_colors[v]
+            if pre_color >= 0:
+                for u in neighbors:
+                    if out[u] == pre_color:
+                        return v
+                out[v] = pre_color
                 continue
 
-            available_colors = set(range(len(self.graph.vertices)))
+            # Bit c of `forbidden` is set when color c is taken by a neighbor or excluded.
+            # At most deg(v) + |exclusions| colors can be forbidden, so the answer never exceeds
+            # that bound and larger neighbor colors are skipped to keep the mask small.
+            forbidden = exclusion_mask[v]
+            limit = len(neighbors) + bin(forbidden).count("1")
+            for u in neighbors:
+                color = out[u]
+                if 0 <= color <= limit:
+                    forbidden |= 1 << color
+
+            # The lowest set bit of ~forbidden is the smallest legal color.
+            free = ~forbidden
+            color = (free & -free).bit_length() - 1
+            if color < num_colors:
+                out[v] = color
+        return -1
+
+    def solve(self):
+        self.load_colors()
+        self.uncolored = None
+        labels = self.vertex_labels
+        indptr = self.graph.indptr
+        num_vertices = len(self.graph.vertices)
+        self.constraint_manager.finalize(num_vertices)
+        exclusion_mask = self.constraint_manager.exclusion_mask
+        pre_assigned_colors = self.constraint_manager.pre_assigned_colors
+
+        exclusion_masks = [exclusion_mask.get(vertex, 0) for vertex in labels[:num_vertices]]
+        pre_colors = array('i', [pre_assigned_colors.get(vertex, -1) for vertex in labels[:num_vertices]])
+
+        # Pre-assigned vertices go first so no free vertex can take their color before them.
+        # The rest follow in largest-first (Welsh-Powell) order: high-degree vertices are
+        # colored while few colors are in use, which usually needs fewer colors than an
+        # arbitrary order. The sort is stable, so equal keys keep their id order.
+        order = sorted(range(num_vertices), key=lambda v: (pre_colors[v] < 0, indptr[v] - indptr[v + 1]))
+
+        conflict = self.greedy_csr(indptr, self.graph.indices, exclusion_masks, pre_colors, self.colors, order)
+        if conflict >= 0:
+            raise ValueError(f"Conflict with pre-assigned color at vertex {labels[conflict]}")
+        return self.color_assignment
+
+    def solve_incremental(self, changed_vertices):
+        """
+        Repairs the current coloring after the given vertices changed.
+
+        Only the changed vertices and the vertices left uncolored so far are revisited:
+        removed vertices are dropped, and a vertex keeps its color unless it is missing,
+        excluded or shared with a neighbor, in which case it gets the smallest legal color. A pre-assigned vertex always takes its color,
+        and any neighbor holding that color is queued to be recolored in turn. The mutable
+        adjacency lists are used directly, so the CSR arrays are not rebuilt and the work is
+        proportional to the degrees of the visited vertices rather than to the graph size.
+        """
+        adjacency_list = self.graph.adjacency_list
+        vertices = self.graph.vertices
+        num_vertices = len(vertices)
+        self.constraint_manager.finalize(num_vertices)
+        exclusion_mask = self.constraint_manager.exclusion_mask
+        colors, vertex_index, labels = self.colors, self.vertex_index, self.vertex_labels
+        color_of = self.color_of
+        if self.uncolored is None:
+            # The first repair after a full solve finds the vertices it could not color once.
+            self.uncolored = {labels[slot] for slot, color in enumerate(colors) if color < 0}
+        worklist = deque(changed_vertices)
+        worklist.extend(self.uncolored)
+        uncolored = self.uncolored = set()
+        while worklist:
+            vertex = worklist.popleft()
+            slot = vertex_index.get(vertex)
+            if vertex not in vertices:
+                if slot is not None:
+                    colors[slot] = -1
+                continue
+            if slot is None:
+                # New vertices get fresh slots; the CSR ids are only realigned by a full solve.
+                slot = vertex_index[vertex] = len(labels)
+                labels.append(vertex)
+                colors.append(-1)
+            neighbors = adjacency_list.get(vertex, ())
+            neighbor_colors = [color_of(neighbor) for neighbor in neighbors]
 
             pre_assigned_color = self.constraint_manager.get_pre_assigned_color(vertex)
             if pre_assigned_color is not None:
-                for neighbor in self.graph.neighbors(vertex):
-                    if self.color_assignment.get(neighbor) == pre_assigned_color:
-                        raise ValueError(f"Conflict with pre-assigned color at vertex {vertex}")
-                self.color_assignment[vertex] = pre_assigned_color
+                colors[slot] = pre_assigned_color
+                for neighbor, color in zip(neighbors, neighbor_colors):
+                    if color == pre_assigned_color:
+                        if self.constraint_manager.get_pre_assigned_color(neighbor) == pre_assigned_color:
+                            raise ValueError(f"Conflict with pre-assigned color at vertex {vertex}")
+                        worklist.append(neighbor)
+                continue
+
+            color = colors[slot]
+            forbidden = exclusion_mask.get(vertex, 0)
+            if color >= 0 and not (forbidden >> color) & 1 and color not in neighbor_colors:
+                continue
+
+            limit = len(neighbors) + bin(forbidden).count("1")
+            for color in neighbor_colors:
+                if 0 <= color <= limit:
+                    forbidden |= 1 << color
+            free = ~forbidden
+            color = (free & -free).bit_length() - 1
+            if color < num_vertices:
+                colors[slot] = color
+            else:
+                colors[slot] = -1
+                uncolored.add(vertex)
+
+        return self.color_assignment
+
+# SpeculativeColoringSolver Class
+class SpeculativeColoringSolver(GreedyColoringSolver):
+    """
+    Implements speculative greedy graph coloring (Gebremedhin-Manne), considering constraints.
+
+    Vertices are colored in rounds. In each round the pending vertices are split into blocks,
+    one per simulated worker. Each block is colored greedily in order and sees its own writes,
+    but sees the other blocks only as they were at the start of the round, as if the blocks
+    ran in parallel. Adjacent vertices in different blocks that picked the same color are then
+    detected, the lower id of each clashing pair is uncolored, and only those vertices are
+    retried in the next round.
+    
+    Methods:
+        greedy_csr(indptr, indices, exclusion_mask, pre_colors, out, order, num_blocks): Speculative coloring kernel over CSR arrays.
+    """
+    @staticmethod
+    def greedy_csr(indptr, indices, exclusion_mask, pre_colors, out, order, num_blocks=4):
+        """
+        Speculative coloring kernel over CSR arrays.
+
+        Same contract as GreedyColoringSolver.greedy_csr. The blocks of a round only read the
+        colors fixed before the round and their own writes, so they could be colored by
+        separate workers. Conflicts can only occur between blocks. Each round keeps at least
+        the highest pending id, so the loop terminates.
+        """
+        num_colors = len(order)
+        pending = []
+        for v in order:
+            if out[v] >= 0:
+                continue
+            pre_color = pre_colors[v]
+            if pre_color < 0:
+                pending.append(v)
                 continue
+            for u in indices[indptr[v]:indptr[v + 1]]:
+                if out[u] == pre_color:
+                    return v
+            out[v] = pre_color
 
-            for neighbor in self.graph.neighbors(vertex):
-                if neighbor in self.color_assignment:
-                    color = self.color_assignment[neighbor]
-                    available_colors.discard(color)
+        while pending:
+            # Tentative phase: color each block in order, then hide its writes again so the
+            # next block sees the round-start state; all blocks are published together.
+            block_size = -(-len(pending) // num_blocks)
+            tentative = []
+            for start in range(0, len(pending), block_size):
+                block = pending[start:start + block_size]
+                for v in block:
+                    neighbors = indices[indptr[v]:indptr[v + 1]]
+                    forbidden = exclusion_mask[v]
+                    limit = len(neighbors) + bin(forbidden).count("1")
+                    for u in neighbors:
+                        color = out[u]
+                        if 0 <= color <= limit:
+                            forbidden |= 1 << color
+                    free = ~forbidden
+                    color = (free & -free).bit_length() - 1
+                    if color < num_colors:
+                        out[v] = color
+                tentative.extend([out[v] for v in block])
+                for v in block:
+                    out[v] = -1
+            for v, color in zip(pending, tentative):
+                out[v] = color
 
-            for color in available_colors:
-                if not self.constraint_manager.is_color_excluded(vertex, color):
-                    self.color_assignment[vertex] = color
-                    break
+            # Conflict phase: of two neighbors colored alike this round, the lower id retries.
+            conflicts = []
+            for v in pending:
+                color = out[v]
+                if color < 0:
+                    continue
+                for u in indices[indptr[v]:indptr[v + 1]]:
+                    if u > v and out[u] == color:
+                        conflicts.append(v)
+                        break
+            for v in conflicts:
+                out[v] = -1
+            pending = conflicts
+        return -1
+
+# DSaturColoringSolver Class
+class DSaturColoringSolver(GreedyColoringSolver):
+    """
+    Implements greedy graph coloring in DSatur order, considering constraints.
+
+    Instead of a fixed vertex order, the next vertex is always the uncolored one with the most
+    distinct neighbor colors, ties broken by degree. This usually needs fewer colors than a
+    fixed order and colors bipartite graphs optimally.
+    
+    Methods:
+        solve(): Solves the graph coloring problem using the DSatur heuristic.
+    """
+    def solve(self):
+        self.load_colors()
+        self.uncolored = None
+        labels = self.vertex_labels
+        colors = self.colors
+        num_vertices = len(self.graph.vertices)
+        self.constraint_manager.finalize(num_vertices)
+        exclusion_mask = self.constraint_manager.exclusion_mask
+        queue = SaturationQueue(self.graph, colors)
+
+        for index in range(num_vertices):
+            if colors[index] >= 0:
+                queue.assign(index, colors[index])
+        for index in range(num_vertices):
+            vertex = labels[index]
+            pre_assigned_color = self.constraint_manager.get_pre_assigned_color(vertex)
+            if colors[index] >= 0 or pre_assigned_color is None:
+                continue
+            if pre_assigned_color in queue.neighbor_colors[index]:
+                raise ValueError(f"Conflict with pre-assigned color at vertex {vertex}")
+            queue.assign(index, pre_assigned_color)
+        for index in range(num_vertices):
+            if colors[index] < 0:
+                queue.push(index)
+
+        indptr = self.graph.indptr
+        neighbor_colors = queue.neighbor_colors
+        index = queue.pop_max()
+        while index >= 0:
+            vertex = labels[index]
+            # Same bounded smallest-legal-color search as greedy_csr, over the neighbor colors
+            # the queue already tracks.
+            forbidden = exclusion_mask.get(vertex, 0)
+            limit = indptr[index + 1] - indptr[index] + bin(forbidden).count("1")
+            for color in neighbor_colors[index]:
+                if 0 <= color <= limit:
+                    forbidden |= 1 << color
+            free = ~forbidden
+            color = (free & -free).bit_length() - 1
+            if color < num_vertices:
+                queue.assign(index, color)
+            index = queue.pop_max()
 
         return self.color_assignment
 
@@ -169,39 +731,104 @@ class BacktrackingColoringSolver(BaseColoringSolver):
     """
     Implements a backtracking algorithm to minimize the number of colors used in graph coloring.
     
+    Attributes:
+        exclusion_masks (list): Bitmask of excluded colors for each vertex id, built by solve().
+    
     Methods:
-        is_valid(vertex, color): Checks if assigning a color to a vertex is valid.
-        solve_util(vertex_list, idx): Utility function to recursively solve the coloring problem.
+        is_valid(index, color): Checks if assigning a color to a vertex id is valid.
+        forbidden_mask(queue, index): Returns a bitmask of the colors in [0, n) that a vertex id cannot take right now.
+        solve_util(queue): Utility function to iteratively solve the coloring problem in DSatur order.
         solve(): Solves the graph coloring problem using backtracking.
     """
-    def is_valid(self, vertex, color):
-        for neighbor in self.graph.neighbors(vertex):
-            if self.color_assignment.get(neighbor) == color:
+    def __init__(self, graph, constraint_manager):
+        super().__init__(graph, constraint_manager)
+        self.exclusion_masks = []
+
+    def is_valid(self, index, color):
+        """
+        Checks if assigning a color to a vertex id is valid.
+
+        Uncolored neighbors hold -1 in `colors`, which never equals a candidate color, so
+        each neighbor costs a single comparison and no hashing.
+        """
+        # The exclusion test is a single shift on the precomputed mask, so it runs first.
+        if (self.exclusion_masks[index] >> color) & 1:
+            return False
+        colors = self.colors
+        indptr = self.graph.indptr
+        for neighbor in self.graph.indices[indptr[index]:indptr[index + 1]]:
+            if colors[neighbor] == color:
                 return False
-        return not self.constraint_manager.is_color_excluded(vertex, color)
+        return True
 
-    def solve_util(self, vertex_list, idx):
-        if idx == len(vertex_list):
-            return True
+    def forbidden_mask(self, queue, index):
+        """Returns a bitmask of the colors in [0, n) that a vertex id cannot take right now."""
+        num_colors = len(self.graph.vertices)
+        forbidden = self.exclusion_masks[index]
+        for color in queue.neighbor_colors[index]:
+            if 0 <= color < num_colors:
+                forbidden |= 1 << color
+        return forbidden
 
-        vertex = vertex_list[idx]
-        pre_assigned_color = self.constraint_manager.get_pre_assigned_color(vertex)
-        if pre_assigned_color is not None:
-            self.color_assignment[vertex] = pre_assigned_color
-            return self.solve_util(vertex_list, idx + 1)
+    def solve_util(self, queue):
+        """
+        Colors the vertices in `queue` by depth-first search with an explicit stack.
 
-        for color in range(len(self.graph.vertices)):
-            if self.is_valid(vertex, color):
-                self.color_assignment[vertex] = color
-                if self.solve_util(vertex_list, idx + 1):
-                    return True
-                self.color_assignment.pop(vertex)
+        The next vertex is always the one with maximum saturation (DSatur), which prunes the
+        search tree far better than a fixed order. Each stack entry is (vertex id, bitmask of
+        forbidden colors, next color to try) for a vertex that currently holds a color. The
+        search only returns to a vertex after everything colored below it has been uncolored,
+        so the mask computed when the vertex was picked stays valid. The mask only covers the
+        colors seen around the vertex, so the stack stays small even on long paths. When a
+        vertex runs out of colors it goes back into the queue and the search resumes the
+        parent, so the depth is not limited by Python's recursion limit.
+        """
+        forbidden_mask = self.forbidden_mask
+        pop_max = queue.pop_max
+        num_colors = len(self.graph.vertices)
+        stack = []
+        index = pop_max()
+        forbidden = forbidden_mask(queue, index) if index >= 0 else 0
+        next_color = 0
+        while index >= 0:
+            free = ~forbidden & -(1 << next_color)
+            color = (free & -free).bit_length() - 1
+            if color < num_colors:
+                queue.assign(index, color)
+                stack.append((index, forbidden, color + 1))
+                index = pop_max()
+                if index >= 0:
+                    forbidden = forbidden_mask(queue, index)
+                    next_color = 0
+                continue
 
-        return False
+            queue.push(index)
+            if not stack:
+                return False
+            index, forbidden, next_color = stack.pop()
+            queue.unassign(index)
+        return True
 
     def solve(self):
-        vertex_list = list(self.graph.vertices)
-        if self.solve_util(vertex_list, 0):
+        self.load_colors(keep=False)
+        labels = self.vertex_labels
+        num_vertices = len(self.graph.vertices)
+        self.constraint_manager.finalize(num_vertices)
+        exclusion_mask = self.constraint_manager.exclusion_mask
+        self.exclusion_masks = [exclusion_mask.get(vertex, 0) for vertex in labels]
+        queue = SaturationQueue(self.graph, self.colors)
+
+        for index in range(num_vertices):
+            pre_assigned_color = self.constraint_manager.get_pre_assigned_color(labels[index])
+            if pre_assigned_color is not None:
+                if not self.is_valid(index, pre_assigned_color):
+                    raise ValueError(f"Conflict with pre-assigned color at vertex {labels[index]}")
+                queue.assign(index, pre_assigned_color)
+        for index in range(num_vertices):
+            if self.colors[index] < 0:
+                queue.push(index)
+
+        if self.solve_util(queue):
             return self.color_assignment
         else:
             raise ValueError("No valid coloring exists with the given constraints")
@@ -234,15 +861,30 @@ class HeuristicOptimizer:
     
     Attributes:
         solver (BaseColoringSolver): The current coloring solver strategy.
+        solved (bool): Whether the solver has produced a full coloring that can be repaired incrementally.
     
     Methods:
         optimize(): Executes the solver's solve method and applies heuristic optimizations.
     """
     def __init__(self, solver):
         self.solver = solver
+        self.solved = False
 
     def optimize(self):
-        return self.solver.solve()
+        """
+        Colors the graph, repairing the previous coloring when possible.
+
+        After a first full solve, greedy solvers only revisit the vertices the graph recorded
+        as changed since the last call instead of recoloring the whole graph.
+        """
+        graph = self.solver.graph
+        if self.solved and isinstance(self.solver, GreedyColoringSolver):
+            result = self.solver.solve_incremental(graph.changed_vertices)
+        else:
+            result = self.solver.solve()
+        graph.changed_vertices.clear()
+        self.solved = True
+        return result
 
 # SolverFactory Class (Factory Pattern)
 class SolverFactory:
@@ -256,6 +898,10 @@ class SolverFactory:
     def create_solver(strategy, graph, constraint_manager):
         if strategy == "greedy":
             return GreedyColoringSolver(graph, constraint_manager)
+        elif strategy == "speculative":
+            return SpeculativeColoringSolver(graph, constraint_manager)
+        elif strategy == "dsatur":
+            return DSaturColoringSolver(graph, constraint_manager)
         elif strategy == "backtracking":
             return BacktrackingColoringSolver(graph, constraint_manager)
         else:
@@ -287,9 +933,10 @@ class TestGraphColoringEnhanced(unittest.TestCase):
         self.graph.add_edge(0, 1)
         self.graph.add_edge(1, 2)
         result = self.backtracking_solver.solve()
-        self.assertEqual(result[0], 0)
-        self.assertEqual(result[1], 1)
-        self.assertEqual(result[2], 0)
+        # DSatur colors the highest-degree vertex first.
+        self.assertEqual(result[0], 1)
+        self.assertEqual(result[1], 0)
+        self.assertEqual(result[2], 1)
 
     def test_preassigned_colors(self):
         self.graph.add_vertex(0)
@@ -315,6 +962,106 @@ class TestGraphColoringEnhanced(unittest.TestCase):
         self.assertEqual(result[1], 1)
         self.assertEqual(result[2], 0)
 
+    def test_greedy_color_exclusion(self):
+        self.graph.add_vertex(0)
+        self.graph.add_vertex(1)
+        self.graph.add_edge(0, 1)
+        self.constraint_manager.add_color_exclusion(0, 0)
+        self.constraint_manager.add_color_exclusion(1, 1)
+        result = self.greedy_solver.solve()
+        self.assertNotEqual(result[0], 0)
+        self.assertNotEqual(result[1], 1)
+        self.assertNotEqual(result[0], result[1])
+
+    def test_negative_color_exclusion(self):
+        self.graph.add_vertex(0)
+        self.constraint_manager.add_color_exclusion(0, -1)
+        self.assertTrue(self.constraint_manager.is_color_excluded(0, -1))
+        self.assertFalse(self.constraint_manager.is_color_excluded(0, -2))
+        self.assertFalse(self.constraint_manager.is_color_excluded(1, -1))
+        self.assertEqual(self.greedy_solver.solve(), {0: 0})
+
+    def test_large_color_exclusion(self):
+        for i in range(3):
+            self.graph.add_vertex(i)
+        self.graph.add_edge(0, 1)
+        self.constraint_manager.add_color_exclusion(0, 10**7)
+        self.constraint_manager.add_color_exclusion(2, 4)
+        # Colors no solve can hand out yet get no mask bit, so the masks stay small.
+        self.assertEqual(self.constraint_manager.exclusion_mask.get(0, 0), 0)
+        self.assertTrue(self.constraint_manager.is_color_excluded(0, 10**7))
+        self.assertEqual(dict(self.greedy_solver.solve()), {0: 0, 1: 1, 2: 0})
+
+        # Once the graph has enough vertices to use color 4, the exclusion takes effect.
+        for i in range(3, 6):
+            self.graph.add_vertex(i)
+            self.graph.add_edge(2, i)
+        self.graph.add_edge(3, 4)
+        self.graph.add_edge(4, 5)
+        self.graph.add_edge(3, 5)
+        self.constraint_manager.add_color_exclusion(2, 0)
+        self.constraint_manager.add_color_exclusion(2, 1)
+        self.constraint_manager.add_color_exclusion(2, 2)
+        self.constraint_manager.add_color_exclusion(2, 3)
+        result = self.backtracking_solver.solve()
+        self.assertEqual(result[2], 5)
+        self.assertEqual(self.constraint_manager.exclusion_mask[2], 0b11111)
+
+    def test_greedy_preassigned_conflict(self):
+        self.graph.add_vertex(0)
+        self.graph.add_vertex(1)
+        self.graph.add_edge(0, 1)
+        self.greedy_solver.color_assignment[0] = 0
+        self.constraint_manager.add_pre_assigned_color(1, 0)
+        with self.assertRaises(ValueError):
+            self.greedy_solver.solve()
+
+    def test_greedy_preassigned_first(self):
+        # Vertex 1 has the highest degree but must not take vertex 0's pre-assigned color.
+        for i in range(3):
+            self.graph.add_vertex(i)
+        self.graph.add_edge(0, 1)
+        self.graph.add_edge(1, 2)
+        self.constraint_manager.add_pre_assigned_color(0, 0)
+        result = self.greedy_solver.solve()
+        self.assertEqual(result[0], 0)
+        self.assertNotEqual(result[1], 0)
+        self.assertNotEqual(result[1], result[2])
+
+    def test_greedy_largest_first(self):
+        # Path 0-2-3-1: index order needs 3 colors, largest-first needs 2.
+        for i in range(4):
+            self.graph.add_vertex(i)
+        self.graph.add_edge(0, 2)
+        self.graph.add_edge(2, 3)
+        self.graph.add_edge(3, 1)
+        result = self.greedy_solver.solve()
+        self.assertEqual(len(set(result.values())), 2)
+
+    def test_color_assignment_writes(self):
+        self.graph.add_vertex(0)
+        self.graph.add_vertex(1)
+        self.graph.add_edge(0, 1)
+        self.greedy_solver.color_assignment[1] = 2
+        result = self.greedy_solver.solve()
+        self.assertIs(result, self.greedy_solver.color_assignment)
+        self.assertEqual(result, {0: 0, 1: 2})
+        del result[1]
+        self.assertNotIn(1, result)
+        with self.assertRaises(ValueError):
+            result[0] = -1
+        snapshot = result.copy()
+        self.assertEqual(type(snapshot), dict)
+        self.assertEqual(snapshot, {0: 0})
+        result[0] = 1
+        self.assertEqual(snapshot, {0: 0})
+
+    def test_negative_preassigned_color(self):
+        self.graph.add_vertex(0)
+        with self.assertRaises(ValueError):
+            self.constraint_manager.add_pre_assigned_color(0, -2)
+        self.assertIsNone(self.constraint_manager.get_pre_assigned_color(0))
+
     def test_dynamic_graph_changes(self):
         self.graph.add_vertex(0)
         self.graph.add_vertex(1)
@@ -322,25 +1069,194 @@ class TestGraphColoringEnhanced(unittest.TestCase):
         self.graph.add_edge(0, 1)
         self.graph.add_edge(1, 2)
         result = self.backtracking_solver.solve()
-        self.assertEqual(result[0], 0)
-        self.assertEqual(result[1], 1)
-        self.assertEqual(result[2], 0)
+        # DSatur colors the highest-degree vertex first.
+        self.assertEqual(result[0], 1)
+        self.assertEqual(result[1], 0)
+        self.assertEqual(result[2], 1)
         changes = [('add_vertex', 3, None), ('add_edge', 1, 3)]
         self.graph.apply_dynamic_changes(changes)
         self.graph.print_graph()  # Print graph after dynamic changes
         result = self.optimizer.optimize()
         self.assertTrue(result[0] == 0 or result[0] == 1)
 
+    def test_backtracking_deep_graph(self):
+        num_vertices = 3000
+        for i in range(num_vertices):
+            self.graph.add_vertex(i)
+        for i in range(num_vertices - 1):
+            self.graph.add_edge(i, i + 1)
+        result = self.backtracking_solver.solve()
+        self.assertEqual(len(result), num_vertices)
+        for i in range(num_vertices - 1):
+            self.assertNotEqual(result[i], result[i + 1])
+
+    def test_backtracking_infeasible(self):
+        for i in range(3):
+            self.graph.add_vertex(i)
+        self.graph.add_edge(0, 1)
+        self.graph.add_edge(1, 2)
+        self.graph.add_edge(0, 2)
+        self.constraint_manager.add_color_exclusion(2, 2)
+        self.constraint_manager.add_pre_assigned_color(0, 0)
+        self.constraint_manager.add_pre_assigned_color(1, 1)
+        with self.assertRaises(ValueError):
+            self.backtracking_solver.solve()
+
+    def test_backtracking_preassigned_conflict(self):
+        self.graph.add_vertex(0)
+        self.graph.add_vertex(1)
+        self.graph.add_edge(0, 1)
+        self.constraint_manager.add_pre_assigned_color(0, 0)
+        self.constraint_manager.add_pre_assigned_color(1, 0)
+        with self.assertRaises(ValueError):
+            self.backtracking_solver.solve()
+
+        # A pre-assigned color that is also excluded for the same vertex is a conflict too.
+        self.constraint_manager.add_pre_assigned_color(1, 1)
+        self.constraint_manager.add_color_exclusion(1, 1)
+        with self.assertRaises(ValueError):
+            self.backtracking_solver.solve()
+
+    def test_dsatur_bipartite(self):
+        # Crown graph: greedy in index order needs 4 colors here, DSatur needs 2.
+        for i in range(8):
+            self.graph.add_vertex(i)
+        for i in range(4):
+            for j in range(4):
+                if i != j:
+                    self.graph.add_edge(2 * i, 2 * j + 1)
+        solver = SolverFactory.create_solver("dsatur", self.graph, self.constraint_manager)
+        result = solver.solve()
+        self.assertEqual(len(set(result.values())), 2)
+        for u in range(8):
+            for v in self.graph.neighbors(u):
+                self.assertNotEqual(result[u], result[v])
+
+    def test_speculative_coloring(self):
+        num_vertices = 300
+        for i in range(num_vertices):
+            self.graph.add_vertex(i)
+        for _ in range(1500):
+            u, v = random.sample(range(num_vertices), 2)
+            self.graph.add_edge(u, v)
+        self.constraint_manager.add_pre_assigned_color(0, 3)
+        self.constraint_manager.add_color_exclusion(1, 0)
+        solver = SolverFactory.create_solver("speculative", self.graph, self.constraint_manager)
+        result = solver.solve()
+        self.assertEqual(len(result), num_vertices)
+        self.assertEqual(result[0], 3)
+        self.assertNotEqual(result[1], 0)
+        for u in range(num_vertices):
+            for v in self.graph.neighbors(u):
+                self.assertNotEqual(result[u], result[v])
+
+    def test_duplicate_edges(self):
+        self.graph.add_vertex(0)
+        self.graph.add_vertex(1)
+        self.graph.add_edge(0, 1)
+        self.graph.add_edge(1, 0)
+        self.graph.add_edges_bulk([(0, 1), (1, 0)])
+        self.graph.finalize()
+        self.assertEqual(self.graph.neighbors(0), [1])
+        self.assertEqual(self.graph.neighbors(1), [0])
+        self.graph.remove_edge(0, 1)
+        self.assertEqual(self.graph.neighbors(0), [])
+        self.assertEqual(self.graph.neighbors(1), [])
+
+        # Repeats added after the last finalize() are removed together with the edge.
+        self.graph.add_edge(0, 1)
+        self.graph.add_edge(0, 1)
+        self.graph.remove_edge(1, 0)
+        self.assertEqual(self.graph.neighbors(0), [])
+        self.graph.add_edge(0, 1)
+        self.graph.add_edge(1, 0)
+        self.graph.remove_vertex(1)
+        self.assertEqual(self.graph.neighbors(0), [])
+        self.assertEqual(self.graph.neighbors(1), [])
+
+    def test_incremental_changes(self):
+        for i in range(6):
+            self.graph.add_vertex(i)
+        for i in range(5):
+            self.graph.add_edge(i, i + 1)
+        before = dict(self.optimizer.optimize())
+        changes = [('add_edge', 0, 2), ('add_vertex', 6, None), ('add_edge', 6, 5), ('remove_vertex', 3, None)]
+        self.graph.apply_dynamic_changes(changes)
+        result = self.optimizer.optimize()
+        self.assertNotIn(3, result)
+        self.assertEqual(result[4], before[4])
+        self.assertIn(6, result)
+        for u in self.graph.vertices:
+            for v in self.graph.neighbors(u):
+                self.assertNotEqual(result[u], result[v])
+        self.assertEqual(len(self.graph.changed_vertices), 0)
+
+    def test_incremental_retries_uncolored(self):
+        # With one vertex, its only color is excluded; a second vertex frees color 1.
+        self.graph.add_vertex(0)
+        self.constraint_manager.add_color_exclusion(0, 0)
+        self.assertEqual(dict(self.optimizer.optimize()), {})
+        self.graph.add_vertex(1)
+        self.assertEqual(dict(self.optimizer.optimize()), {0: 1, 1: 0})
+
+    def test_incremental_remove_edge(self):
+        self.graph.add_vertex(0)
+        self.graph.add_vertex(1)
+        self.graph.add_edge(0, 1)
+        self.constraint_manager.add_color_exclusion(1, 1)
+        self.assertEqual(dict(self.optimizer.optimize()), {0: 0})
+        self.graph.remove_edge(0, 1)
+        self.assertEqual(self.graph.changed_vertices, {0, 1})
+        self.assertEqual(dict(self.optimizer.optimize()), {0: 0, 1: 0})
+
+    def test_batched_dynamic_changes(self):
+        changes = [('add_vertex', 0, None), ('add_vertex', 1, None), ('add_edge', 0, 1),
+                   ('remove_edge', 0, 1), ('add_edge', 1, 0), ('add_vertex', 2, None)]
+        self.graph.apply_dynamic_changes(changes)
+        self.assertEqual(self.graph.vertices, {0, 1, 2})
+        self.assertEqual(self.graph.neighbors(0), [1])
+        self.assertEqual(self.graph.neighbors(1), [0])
+
+    def test_remove_vertex(self):
+        for i in range(3):
+            self.graph.add_vertex(i)
+        self.graph.add_edge(0, 1)
+        self.graph.add_edge(1, 2)
+        self.graph.add_edge(1, 1)
+        self.graph.remove_vertex(1)
+        self.assertNotIn(1, self.graph.adjacency_list)
+        self.assertEqual(self.graph.neighbors(0), [])
+        self.assertEqual(self.graph.neighbors(2), [])
+
+    def test_csr_layout(self):
+        self.graph.add_vertex(0)
+        self.graph.add_vertex(1)
+        self.graph.add_vertex(2)
+        self.graph.add_edge(0, 1)
+        self.graph.add_edge(1, 2)
+        self.graph.finalize()
+        index = self.graph.vertex_index
+        labels = self.graph.vertex_labels
+        self.assertEqual(len(self.graph.indptr), 4)
+        self.assertEqual(len(self.graph.indices), 4)
+        self.assertEqual({labels[i] for i in self.graph.neighbor_ids(index[1])}, {0, 2})
+        self.graph.add_edge(2, 1)
+        self.assertIsNone(self.graph.indptr)
+        self.graph.finalize()
+        self.assertEqual(len(self.graph.indices), 4)
+        self.graph.remove_edge(1, 2)
+        self.assertIsNone(self.graph.indptr)
+        self.graph.finalize()
+        self.assertEqual([labels[i] for i in self.graph.neighbor_ids(index[1])], [0])
+
     def test_large_graph_performance(self):
         num_vertices = 10000
         num_edges = 50000
         for i in range(num_vertices):
             self.graph.add_vertex(i)
-        for _ in range(num_edges):
-            u = random.randint(0, num_vertices - 1)
-            v = random.randint(0, num_vertices - 1)
-            if u != v:
-                self.graph.add_edge(u, v)
+        us = random.choices(range(num_vertices), k=num_edges)
+        vs = random.choices(range(num_vertices), k=num_edges)
+        self.graph.add_edges_bulk((u, v) for u, v in zip(us, vs) if u != v)
         result = self.optimizer.optimize()
         self.assertTrue(len(set(result.values())) <= num_vertices)
 